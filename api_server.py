@@ -4,20 +4,57 @@ This approach keeps project.py running independently and communicates via files
 """
 
 import asyncio
+import ctypes
+import errno
+import importlib.util
 import json
+import mmap
 import os
-import subprocess
+import sys
 import signal
+import struct
+import tempfile
 import psutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Literal, Optional, Any, Tuple
 import time
+from contextlib import contextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, validator
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, field_validator
 import uvicorn
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+# fcntl is POSIX-only; on Windows the API server runs as a single worker
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# orjson is optional; fall back to the stdlib encoder/decoder without it
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+    
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
 
 # FastAPI app instance
 app = FastAPI(
@@ -35,12 +72,71 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global variables to track the external process
-project_process: Optional[subprocess.Popen] = None
+# In-memory copy of the newest audit record, kept current by the audit log
+# watcher so that /status and /analysis do not touch the disk
+app.state.latest_record = None
+app.state.audit_observer = None
+app.state.watched_audit_file = None
+
+# Preformatted /health body, refreshed by a background task
+app.state.health_bytes = None
+app.state.health_task = None
+
+# project.py child started by this worker; other workers find it via the PID file
+app.state.child_proc = None
+
+# Files used to track the external process across workers
 project_pid_file = "project_service.pid"
+project_pid_lock_file = project_pid_file + ".lock"
+project_start_lock_file = "project_service.start.lock"
+# Written by project.py itself (PID inside) once its startup has succeeded
+project_ready_file = "project_service.ready"
+
+# Startup polling: back off exponentially, never sleeping longer than the cap.
+# project.py imports numpy/pandas/PyPortfolioOpt before reporting ready, which
+# is slow on small hosts; the default stays below the frontend's 30 s timeout
+STARTUP_TIMEOUT = float(os.getenv('PORTFOLIO_STARTUP_TIMEOUT', '25'))
+STARTUP_POLL_INITIAL_DELAY = 0.05
+STARTUP_POLL_MAX_DELAY = 2.0
+
+# Linux-only inotify interface used to wake up when project.py reports ready
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0)
+_libc = ctypes.CDLL(None, use_errno=True) if sys.platform.startswith('linux') else None
+
+# Block size used when reading the audit log backwards from its end
+TAIL_CHUNK_SIZE = 8192
+
+# psutil.Process handles reused across endpoints, keyed by PID
+_PROC_CACHE: Dict[int, psutil.Process] = {}
+
+# Disk space reserved ahead of the audit log so it grows into contiguous blocks
+AUDIT_LOG_PREALLOCATE_BYTES = 64 * 1024 * 1024
+FALLOC_FL_KEEP_SIZE = 0x01
+_fallocate = getattr(_libc, 'fallocate64', None)
+if _fallocate is not None:
+    _fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+
+# How often the cached /health payload is regenerated, in seconds
+HEALTH_REFRESH_INTERVAL = 1.0
+
+# Short-lived /status result shared by bursts of dashboard polls
+STATUS_CACHE_TTL = 0.5
+_STATUS_CACHE: Optional[Tuple[float, "ServiceStatus"]] = None
+_STATUS_LOCK = asyncio.Lock()
+
+# Size of one entry in the audit log's `.idx` offset sidecar (uint64)
+AUDIT_INDEX_ENTRY_SIZE = 8
+
+# Last parsed audit record per log path, reused until the file's stat changes
+_LATEST_CACHE: Dict[str, Tuple[int, int, Dict]] = {}
 
 # Pydantic models for API requests/responses
 class ConfigurationRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid', str_strip_whitespace=True)
+    
     api_base_url: str
     api_key: str
     api_secret: Optional[str] = ""
@@ -52,13 +148,22 @@ class ConfigurationRequest(BaseModel):
     position_endpoint: Optional[str] = "/positions"
     audit_log_path: Optional[str] = "audit.log"
 
-    @validator('api_base_url')
-    def validate_https_url(cls, v):
+    @field_validator('api_base_url')
+    @classmethod
+    def validate_https_url(cls, v: str) -> str:
         if not v.startswith('https://'):
             raise ValueError('API URL must use HTTPS')
         return v
 
+    @field_validator('audit_log_path')
+    @classmethod
+    def default_audit_log_path(cls, v: Optional[str]) -> str:
+        # null or blank would otherwise be saved to config.json as-is
+        return v or 'audit.log'
+
 class ServiceStatus(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     running: bool
     pid: Optional[int] = None
     last_rebalance: Optional[str] = None
@@ -66,6 +171,8 @@ class ServiceStatus(BaseModel):
     error_message: Optional[str] = None
 
 class AnalysisResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     timestamp: str
     positions: Dict[str, float]
     weights: Dict[str, float]
@@ -74,87 +181,315 @@ class AnalysisResponse(BaseModel):
     sharpe_ratio: float
 
 class ConfigurationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     message: str
     service_status: str
 
 # Helper functions for process management
+@contextmanager
+def _pid_file_lock(exclusive: bool = True):
+    """Serialize PID file access between uvicorn worker processes (no-op without fcntl)"""
+    if fcntl is None:
+        yield
+        return
+    
+    # A separate lock file, since the PID file itself is removed and recreated
+    fd = os.open(project_pid_lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+    finally:
+        os.close(fd)  # Closing the descriptor releases the lock
+
+@contextmanager
+def _start_lock():
+    """Try to become the only worker starting project.py (yields False otherwise)"""
+    if fcntl is None:
+        yield True
+        return
+    
+    fd = os.open(project_start_lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        # Non-blocking: the lock is held across awaits, where a blocking
+        # flock would stall the event loop
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        yield True
+    finally:
+        os.close(fd)
+
+def _get_proc(pid: int) -> psutil.Process:
+    """Return a shared psutil.Process handle for `pid`, recreating it on PID reuse"""
+    process = _PROC_CACHE.get(pid)
+    # is_running() compares the create_time captured when the handle was made
+    # with the live process, so a recycled PID yields a fresh handle
+    if process is not None and process.is_running():
+        return process
+    
+    _PROC_CACHE.pop(pid, None)
+    process = psutil.Process(pid)
+    _PROC_CACHE[pid] = process
+    return process
+
+def _pid_alive(pid: int) -> bool:
+    """Probe whether `pid` exists by sending it signal 0"""
+    if pid <= 0:
+        return False
+    if os.name == 'nt':
+        # On Windows os.kill terminates the target for any non-console signal
+        return psutil.pid_exists(pid)
+    
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Owned by another user, so it cannot be the service we started
+        return False
+    return True
+
+def _is_project_process(pid: int) -> bool:
+    """Return True if `pid` is actually a project.py process rather than a reused PID"""
+    try:
+        return 'project.py' in ' '.join(_get_proc(pid).cmdline())
+    except psutil.Error:
+        return False
+
 def is_project_running() -> tuple[bool, Optional[int]]:
     """Check if project.py is running and return its PID"""
     try:
-        if os.path.exists(project_pid_file):
-            with open(project_pid_file, 'r') as f:
+        # The service is always started through start_project_service, which
+        # writes the PID file, so only that PID needs to be checked
+        try:
+            with _pid_file_lock(exclusive=False), open(project_pid_file, 'r') as f:
                 pid = int(f.read().strip())
-            
-            # Check if process with this PID exists and is our project
-            if psutil.pid_exists(pid):
-                process = psutil.Process(pid)
-                if 'project.py' in ' '.join(process.cmdline()):
-                    return True, pid
+        except FileNotFoundError:
+            return False, None
         
-        # Also check by process name if PID file is missing
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            try:
-                if proc.info['cmdline'] and any('project.py' in cmd for cmd in proc.info['cmdline']):
-                    return True, proc.info['pid']
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-                
+        if _pid_alive(pid):
+            return True, pid
+        
+        print(f"Warning: PID file {project_pid_file} refers to PID {pid}, which is no longer running")
         return False, None
     except Exception:
         return False, None
 
-def start_project_service() -> subprocess.Popen:
-    """Start the project.py service as a separate process"""
+def _read_ready_pid() -> Optional[int]:
+    """Return the PID project.py wrote to the ready file, if any"""
     try:
-        # Start project.py as a subprocess
-        process = subprocess.Popen(
-            ['python', 'project.py'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=os.getcwd()
-        )
-        
-        # Save PID to file for tracking
-        with open(project_pid_file, 'w') as f:
-            f.write(str(process.pid))
+        with open(project_ready_file, 'r') as f:
+            return int(f.read().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+def _remove_service_files():
+    """Delete the PID and ready files of a stopped (or never started) service"""
+    with _pid_file_lock():
+        for path in (project_pid_file, project_ready_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+def _inotify_watch_ready_dir() -> Optional[int]:
+    """Return an inotify fd watching the ready file's directory, or None if unsupported"""
+    if _libc is None:
+        return None
+    
+    try:
+        fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        directory = os.path.dirname(os.path.abspath(project_ready_file))
+        if _libc.inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+@contextmanager
+def _watch_ready_file():
+    """Yield an async `wait(timeout)` that returns early once project.py reports ready"""
+    fd = _inotify_watch_ready_dir()
+    if fd is None:
+        yield asyncio.sleep
+        return
+    
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    
+    def on_readable():
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        changed.set()
+    
+    async def wait(timeout: float):
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        changed.clear()
+    
+    loop.add_reader(fd, on_readable)
+    try:
+        yield wait
+    finally:
+        loop.remove_reader(fd)
+        os.close(fd)
+
+async def start_project_service(app: FastAPI) -> Optional[asyncio.subprocess.Process]:
+    """Start the project.py service as a separate process (None if another worker has it)"""
+    try:
+        with _start_lock() as acquired:
+            if not acquired:
+                return None
+            running, pid = is_project_running()
+            if running and _is_project_process(pid):
+                return None
+            
+            # A ready file from an earlier run must not satisfy this start
+            _remove_service_files()
+            
+            # Start project.py as a subprocess without blocking the event loop.
+            # Nothing reads its output (it logs to portfolio_service.log), and
+            # an unread pipe would block the child once the buffer fills
+            process = await asyncio.create_subprocess_exec(
+                'python', 'project.py',
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=os.getcwd(),
+                env={
+                    **os.environ,
+                    'PORTFOLIO_READY_FILE': os.path.abspath(project_ready_file),
+                    # project.py ties its lifetime to ours (PR_SET_PDEATHSIG)
+                    'PORTFOLIO_PARENT_PID': str(os.getpid()),
+                }
+            )
+            
+            # Save PID to file for tracking
+            with _pid_file_lock(), open(project_pid_file, 'w') as f:
+                f.write(str(process.pid))
         
+        app.state.child_proc = process
+        invalidate_status_cache()
         return process
     except Exception as e:
         raise Exception(f"Failed to start project.py: {str(e)}")
 
-def stop_project_service() -> bool:
-    """Stop the project.py service"""
+async def wait_for_project_start(
+    app: FastAPI, process: Optional[asyncio.subprocess.Process], timeout: float = STARTUP_TIMEOUT
+) -> tuple[bool, Optional[int]]:
+    """Wait until project.py reports that it started, or exits or times out trying"""
+    deadline = time.monotonic() + timeout
+    delay = STARTUP_POLL_INITIAL_DELAY
+    
+    with _watch_ready_file() as wait:
+        while True:
+            running, pid = is_project_running()
+            if running and _read_ready_pid() == pid:
+                return running, pid
+            
+            # Give up early if the child this request spawned has already
+            # exited; with None another request or worker is starting it
+            if process is not None and process.returncode is not None:
+                return False, None
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Don't leave running a child that the caller reports as failed
+                if process is not None:
+                    await stop_project_service(app, own_only=True)
+                return False, None
+            
+            await wait(min(delay, remaining))
+            delay = min(delay * 2, STARTUP_POLL_MAX_DELAY)
+
+async def stop_project_service(app: FastAPI, own_only: bool = False) -> bool:
+    """Stop the project.py service; with `own_only`, only if this worker spawned it"""
     running, pid = is_project_running()
     if not running or not pid:
+        # A child that crashed on its own must not linger as ours
+        app.state.child_proc = None
+        return True
+    
+    child = app.state.child_proc
+    is_own_child = child is not None and child.pid == pid
+    if own_only and not is_own_child:
         return True
     
     try:
-        process = psutil.Process(pid)
-        process.terminate()
+        if is_own_child:
+            child.terminate()
+            
+            # Wait for graceful shutdown
+            try:
+                await asyncio.wait_for(child.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                child.kill()  # Force kill if it doesn't stop gracefully
+                await child.wait()
+        elif not _is_project_process(pid):
+            # Stale PID file whose PID now belongs to an unrelated process;
+            # leave that process alone and just forget the PID
+            print(f"Warning: PID {pid} in {project_pid_file} is not project.py; removing stale PID file")
+        else:
+            # Started by another worker or an earlier API server instance, so
+            # it is not our child and can only be waited on through psutil
+            process = _get_proc(pid)
+            process.terminate()
+            
+            try:
+                await asyncio.to_thread(process.wait, 10)
+            except psutil.TimeoutExpired:
+                process.kill()
         
-        # Wait for graceful shutdown
-        try:
-            process.wait(timeout=10)
-        except psutil.TimeoutExpired:
-            process.kill()  # Force kill if it doesn't stop gracefully
+        app.state.child_proc = None
+        _PROC_CACHE.pop(pid, None)
+        invalidate_status_cache()
         
-        # Clean up PID file
-        if os.path.exists(project_pid_file):
-            os.remove(project_pid_file)
+        # Clean up PID and ready files
+        _remove_service_files()
         
         return True
     except Exception as e:
         print(f"Error stopping project service: {e}")
         return False
 
+def _atomic_write(path: str, data: bytes):
+    """Write `data` to `path` atomically, readable by the owner only"""
+    # A unique temporary file per call keeps concurrent writers (e.g. from
+    # different workers) from clobbering each other; mkstemp creates it 0o600
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or '.', prefix=os.path.basename(path) + '.', suffix='.tmp'
+    )
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
 def create_env_file(config: ConfigurationRequest):
     """Create .env file with user credentials"""
     env_content = f"""API_URL={config.api_base_url}
 API_TOKEN={config.api_key}
 """
     
-    with open('.env', 'w') as f:
-        f.write(env_content)
+    _atomic_write('.env', env_content.encode())
 
 def create_config_file(config: ConfigurationRequest):
     """Create config.json file with service parameters"""
@@ -168,57 +503,310 @@ def create_config_file(config: ConfigurationRequest):
         "audit_log_path": config.audit_log_path
     }
     
-    with open('config.json', 'w') as f:
-        json.dump(config_data, f, indent=2)
+    _atomic_write('config.json', _json_dumps_pretty(config_data))
+    
+    # Rewrites within the filesystem's timestamp granularity keep the same
+    # mtime, so drop the cached parse explicitly
+    _cached_config_mtime_tuple.cache_clear()
+
+def preallocate_audit_log(audit_file: str):
+    """Create the audit log and reserve disk space for it to grow into (Linux only)"""
+    if _fallocate is None:
+        return
+    
+    # Best effort only: a bad path must never keep the server from starting
+    try:
+        fd = os.open(audit_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC, 0o600)
+    except Exception as e:
+        print(f"Error creating audit log {audit_file}: {e}")
+        return
+    
+    try:
+        # KEEP_SIZE leaves st_size alone; posix_fallocate would pad the log with zeros
+        if _fallocate(fd, FALLOC_FL_KEEP_SIZE, 0, AUDIT_LOG_PREALLOCATE_BYTES) != 0:
+            err = ctypes.get_errno()
+            # Some filesystems (e.g. tmpfs on older kernels, NFS) cannot reserve space
+            if err != errno.EOPNOTSUPP:
+                print(f"Error preallocating audit log {audit_file}: {os.strerror(err)}")
+    except Exception as e:
+        print(f"Error preallocating audit log {audit_file}: {e}")
+    finally:
+        os.close(fd)
+
+def _tail_lines_indexed(path: str, limit: int) -> Optional[Iterator[bytes]]:
+    """Locate the last `limit` records through the `.idx` sidecar (None if it can't be trusted)"""
+    try:
+        idx = open(path + '.idx', 'rb')
+    except FileNotFoundError:
+        return None
+    
+    with idx:
+        n_records = os.fstat(idx.fileno()).st_size // AUDIT_INDEX_ENTRY_SIZE
+        if n_records == 0:
+            return None
+        
+        count = min(limit + 1, n_records)
+        idx.seek((n_records - count) * AUDIT_INDEX_ENTRY_SIZE)
+        offsets = list(struct.unpack(f'<{count}Q', idx.read(count * AUDIT_INDEX_ENTRY_SIZE)))
+    
+    # With the whole index in range, the oldest record starts at offset 0
+    if count <= limit:
+        offsets.insert(0, 0)
+    
+    if any(a > b for a, b in zip(offsets, offsets[1:])):
+        return None
+    
+    with open(path, 'rb') as f:
+        if offsets[-1] != os.fstat(f.fileno()).st_size:
+            return None
+        
+        # The oldest bound must sit on a line boundary, and the oldest slice
+        # must hold a single line; otherwise records are missing from the index
+        if offsets[0] > 0:
+            f.seek(offsets[0] - 1)
+            if f.read(1) != b'\n':
+                return None
+        f.seek(offsets[0])
+        if b'\n' in f.read(offsets[1] - offsets[0]).rstrip(b'\r\n'):
+            return None
+    
+    return _read_indexed_lines(path, offsets, limit)
+
+def _read_indexed_lines(path: str, offsets: List[int], limit: int) -> Iterator[bytes]:
+    """Yield up to `limit` lines bounded by `offsets`, newest first"""
+    count = 0
+    with open(path, 'rb') as f:
+        i = len(offsets) - 1
+        while i > 0:
+            # Gather the newest unread records into one block
+            block_end = offsets[i]
+            j = i - 1
+            while j > 0 and block_end - offsets[j - 1] <= TAIL_CHUNK_SIZE:
+                j -= 1
+            block_start = offsets[j]
+            f.seek(block_start)
+            block = f.read(block_end - block_start)
+            
+            for k in range(i, j, -1):
+                record = block[offsets[k - 1] - block_start:offsets[k] - block_start]
+                # A lost entry in the middle merges neighbouring records
+                for line in reversed(record.split(b'\n')):
+                    line = line.strip()
+                    if line:
+                        yield line
+                        count += 1
+                        if count >= limit:
+                            return
+            i = j
+
+def _tail_lines(path: str, limit: int) -> Iterator[bytes]:
+    """Yield the last `limit` non-empty lines of an append-only file, newest first"""
+    if limit <= 0:
+        return
+
+    indexed = _tail_lines_indexed(path, limit)
+    if indexed is not None:
+        yield from indexed
+        return
+
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        offset = f.tell()
+        buffer = b""
+        count = 0
+
+        while offset > 0:
+            read_size = min(TAIL_CHUNK_SIZE, offset)
+            offset -= read_size
+            f.seek(offset)
+            buffer = f.read(read_size) + buffer
+
+            # Everything after the first newline is complete; the head of the
+            # buffer may be a partial line continued in the previous block.
+            parts = buffer.split(b'\n')
+            buffer = parts[0]
+            for part in reversed(parts[1:]):
+                if part.strip():
+                    yield part
+                    count += 1
+                    if count >= limit:
+                        return
+
+        if buffer.strip():
+            yield buffer
+
+def _tail_json_lines(path: str, limit: int) -> List[Dict]:
+    """Parse the last `limit` JSON lines of an append-only file, newest first"""
+    records = []
+    for line in _tail_lines(path, limit):
+        try:
+            records.append(_json_loads(line))
+        except json.JSONDecodeError:
+            continue
+    return records
+
+def _stream_reverse_lines(path: str, limit: int) -> Iterator[bytes]:
+    """Yield the last `limit` lines as NDJSON, newest first, without re-parsing them"""
+    for line in _tail_lines(path, limit):
+        yield line.rstrip(b'\r') + b'\n'
+
+@lru_cache(maxsize=1)
+def _cached_config_mtime_tuple(mtime_ns: int) -> Dict:
+    """Parse config.json; the mtime argument only serves as the cache key"""
+    # An unreadable or malformed file is cached as empty too, so it is
+    # reported once per change instead of on every request
+    try:
+        with open('config.json', 'rb') as f:
+            config = _json_loads(f.read())
+    except (OSError, ValueError) as e:
+        print(f"Error reading config.json: {e}")
+        return {}
+    return config if isinstance(config, dict) else {}
+
+def _load_config() -> Dict:
+    """Return the parsed config.json, re-reading it only when it changes"""
+    try:
+        mtime_ns = os.stat('config.json').st_mtime_ns
+    except OSError:
+        return {}
+    return _cached_config_mtime_tuple(mtime_ns)
+
+def get_audit_log_path() -> str:
+    """Get the audit log path from config.json, falling back to the default"""
+    audit_file = _load_config().get('audit_log_path')
+    return audit_file if isinstance(audit_file, str) and audit_file else 'audit.log'
 
 def read_latest_audit_record() -> Optional[Dict]:
     """Read the most recent audit record from the log file"""
     try:
-        audit_file = "audit.log"  # Default path, could be from config
+        audit_file = get_audit_log_path()
         
-        # Check if config.json exists to get the actual audit log path
-        if os.path.exists('config.json'):
-            with open('config.json', 'r') as f:
-                config = json.load(f)
-                audit_file = config.get('audit_log_path', 'audit.log')
+        try:
+            stat = os.stat(audit_file)
+        except FileNotFoundError:
+            _LATEST_CACHE.pop(audit_file, None)
+            return None
         
-        if not os.path.exists(audit_file):
+        # The log is append-only, so an unchanged mtime and size means the
+        # last record is still the one we parsed previously
+        cached = _LATEST_CACHE.get(audit_file)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        
+        # Read only the last line (most recent record)
+        records = _tail_json_lines(audit_file, 1)
+        if not records:
             return None
         
-        # Read the last line (most recent record)
-        with open(audit_file, 'r') as f:
-            lines = f.readlines()
-            if not lines:
-                return None
-            
-            last_line = lines[-1].strip()
-            return json.loads(last_line)
+        _LATEST_CACHE[audit_file] = (stat.st_mtime_ns, stat.st_size, records[0])
+        return records[0]
     
     except Exception as e:
         print(f"Error reading audit record: {e}")
         return None
 
+class AuditLogWatcher(FileSystemEventHandler):
+    """File system watcher that refreshes app.state.latest_record on audit log writes"""
+    
+    def __init__(self, audit_file: str, loop: asyncio.AbstractEventLoop):
+        self.audit_file = os.path.abspath(audit_file)
+        self.loop = loop
+    
+    def _refresh(self, path: str):
+        if os.path.abspath(path) != self.audit_file:
+            return
+        record = read_latest_audit_record()
+        # Events arrive on the observer thread; hand the result to the event
+        # loop so endpoints only ever see it assigned from the loop thread
+        self.loop.call_soon_threadsafe(setattr, app.state, 'latest_record', record)
+    
+    def on_created(self, event):
+        self._refresh(event.src_path)
+    
+    def on_modified(self, event):
+        self._refresh(event.src_path)
+    
+    def on_moved(self, event):
+        self._refresh(event.dest_path)
+    
+    def on_deleted(self, event):
+        self._refresh(event.src_path)
+
+def _schedule_audit_watch(observer: Observer, loop: asyncio.AbstractEventLoop) -> Tuple[str, Optional[Dict]]:
+    """Point `observer` at the configured audit log and return it with its newest record"""
+    audit_file = get_audit_log_path()
+    observer.unschedule_all()
+    try:
+        observer.schedule(
+            AuditLogWatcher(audit_file, loop),
+            os.path.dirname(os.path.abspath(audit_file)),
+            recursive=False
+        )
+    except Exception as e:
+        print(f"Error watching audit log {audit_file}: {e}")
+    return audit_file, read_latest_audit_record()
+
+async def watch_audit_log():
+    """(Re)point the audit log observer at the currently configured audit log"""
+    observer = app.state.audit_observer
+    if observer is None:
+        return
+    
+    # Config parsing and the reverse tail read touch the disk, keep them off the loop
+    app.state.watched_audit_file, app.state.latest_record = await asyncio.to_thread(
+        _schedule_audit_watch, observer, asyncio.get_running_loop()
+    )
+
+async def get_latest_record() -> Optional[Dict]:
+    """Return the newest audit record, from memory when the log is being watched"""
+    observer = app.state.audit_observer
+    if observer is not None and observer.emitters:
+        # Another worker may have handled /configure and moved the audit log
+        if app.state.watched_audit_file != get_audit_log_path():
+            await watch_audit_log()
+        return app.state.latest_record
+    return await asyncio.to_thread(read_latest_audit_record)
+
+def read_log_tail(log_file: str, count: int) -> List[str]:
+    """Return the last `count` lines of a text log file"""
+    with open(log_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 or count <= 0:
+            return []
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # A trailing newline terminates the last line rather than
+            # starting an empty one
+            pos = size - 1 if mm[size - 1:size] == b'\n' else size
+            for _ in range(count):
+                pos = mm.rfind(b'\n', 0, pos)
+                if pos == -1:
+                    break
+            window = mm[pos + 1:]
+    
+    return window.decode('utf-8', errors='replace').splitlines(keepends=True)
+
 # API Endpoints
 @app.post("/configure", response_model=ConfigurationResponse)
-async def configure_service(config: ConfigurationRequest):
+async def configure_service(config: ConfigurationRequest, request: Request):
     """Configure and start the portfolio service"""
-    global project_process
-    
     try:
         # Stop existing service if running
-        stop_project_service()
+        if not await stop_project_service(request.app):
+            raise Exception("Failed to stop the running service")
         
         # Create configuration files
-        create_env_file(config)
-        create_config_file(config)
+        # Both writes fsync, so keep them off the event loop
+        await asyncio.to_thread(create_env_file, config)
+        await asyncio.to_thread(create_config_file, config)
+        await asyncio.to_thread(preallocate_audit_log, get_audit_log_path())
+        await watch_audit_log()
         
         # Start the project.py service
-        project_process = start_project_service()
-        
-        # Wait a moment to ensure it started
-        await asyncio.sleep(2)
+        process = await start_project_service(request.app)
         
-        running, pid = is_project_running()
+        # Wait until it is up
+        running, pid = await wait_for_project_start(request.app, process)
         if not running:
             raise Exception("Service failed to start")
         
@@ -230,22 +818,21 @@ async def configure_service(config: ConfigurationRequest):
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Configuration failed: {str(e)}")
 
-@app.get("/status", response_model=ServiceStatus)
-async def get_service_status():
-    """Get the current status of the portfolio service"""
+async def compute_service_status() -> ServiceStatus:
+    """Build a fresh ServiceStatus from the process table and audit log"""
     running, pid = is_project_running()
     
     uptime = None
     if running and pid:
         try:
-            process = psutil.Process(pid)
+            process = _get_proc(pid)
             uptime = time.time() - process.create_time()
         except Exception:
             pass
     
     # Get last rebalance info from audit log
     last_rebalance = None
-    latest_record = read_latest_audit_record()
+    latest_record = await get_latest_record()
     if latest_record:
         last_rebalance = latest_record.get('timestamp')
     
@@ -256,11 +843,36 @@ async def get_service_status():
         uptime_seconds=uptime
     )
 
+def invalidate_status_cache():
+    """Drop the cached ServiceStatus after the service is started or stopped"""
+    global _STATUS_CACHE
+    _STATUS_CACHE = None
+
+@app.get("/status", response_model=ServiceStatus)
+async def get_service_status():
+    """Get the current status of the portfolio service"""
+    global _STATUS_CACHE
+    
+    cached = _STATUS_CACHE
+    if cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+        return cached[1]
+    
+    # Single flight: the first caller computes the status while concurrent
+    # callers wait on the lock and then reuse its result
+    async with _STATUS_LOCK:
+        cached = _STATUS_CACHE
+        if cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+        
+        status = await compute_service_status()
+        _STATUS_CACHE = (time.monotonic(), status)
+        return status
+
 @app.get("/analysis", response_model=AnalysisResponse)
 async def get_latest_analysis():
     """Get the latest portfolio analysis results"""
     try:
-        latest_record = read_latest_audit_record()
+        latest_record = await get_latest_record()
         if not latest_record:
             raise HTTPException(status_code=404, detail="No analysis data available yet")
         
@@ -279,45 +891,38 @@ async def get_latest_analysis():
         raise HTTPException(status_code=500, detail=f"Failed to retrieve analysis: {str(e)}")
 
 @app.get("/audit-log")
-async def get_audit_log(limit: int = 10):
-    """Get recent audit log entries"""
+async def get_audit_log(limit: int = 10, format: Literal["ndjson", "json"] = "ndjson"):
+    """Get recent audit log entries as NDJSON (or JSON with `format=json`), most recent first"""
     try:
-        audit_file = "audit.log"
-        
-        # Get audit file path from config
-        if os.path.exists('config.json'):
-            with open('config.json', 'r') as f:
-                config = json.load(f)
-                audit_file = config.get('audit_log_path', 'audit.log')
+        audit_file = get_audit_log_path()
         
-        if not os.path.exists(audit_file):
-            return {"records": []}
-        
-        # Read recent records
-        records = []
-        with open(audit_file, 'r') as f:
-            lines = f.readlines()
+        if format == "json":
+            if not os.path.exists(audit_file):
+                return {"records": []}
             
-        # Get the last 'limit' lines
-        recent_lines = lines[-limit:] if len(lines) > limit else lines
+            records = await asyncio.to_thread(_tail_json_lines, audit_file, limit)
+            # Plain dicts bypass the response_model fast path; encode them with
+            # orjson (when installed) instead of the stdlib-based JSONResponse
+            return Response(content=_json_dumps({"records": records}), media_type="application/json")
         
-        for line in reversed(recent_lines):  # Most recent first
-            try:
-                record = json.loads(line.strip())
-                records.append(record)
-            except json.JSONDecodeError:
-                continue
+        if not os.path.exists(audit_file):
+            return StreamingResponse(iter(()), media_type="application/x-ndjson")
         
-        return {"records": records}
+        # Starlette iterates synchronous generators in its threadpool, so the
+        # tail reads here already run off the event loop
+        return StreamingResponse(
+            _stream_reverse_lines(audit_file, limit),
+            media_type="application/x-ndjson"
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve audit log: {str(e)}")
 
 @app.post("/stop")
-async def stop_service():
+async def stop_service(request: Request):
     """Stop the portfolio service"""
     try:
-        success = stop_project_service()
+        success = await stop_project_service(request.app)
         if success:
             return {"message": "Portfolio service stopped successfully"}
         else:
@@ -327,18 +932,17 @@ async def stop_service():
         raise HTTPException(status_code=500, detail=f"Failed to stop service: {str(e)}")
 
 @app.post("/restart")
-async def restart_service():
+async def restart_service(request: Request):
     """Restart the portfolio service with current configuration"""
     try:
-        # Stop current service
-        stop_project_service()
-        await asyncio.sleep(1)
+        # Stop current service; this returns once the old process has exited
+        if not await stop_project_service(request.app):
+            raise HTTPException(status_code=500, detail="Failed to stop the running service")
         
         # Start new instance
-        project_process = start_project_service()
-        await asyncio.sleep(2)
+        process = await start_project_service(request.app)
         
-        running, pid = is_project_running()
+        running, pid = await wait_for_project_start(request.app, process)
         if running:
             return {"message": f"Portfolio service restarted successfully (PID: {pid})"}
         else:
@@ -347,10 +951,20 @@ async def restart_service():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to restart service: {str(e)}")
 
+def render_health() -> bytes:
+    """Serialize the /health payload"""
+    return _json_dumps({"status": "healthy", "timestamp": datetime.now().isoformat()})
+
+async def update_health_bytes():
+    """Regenerate the cached /health payload every HEALTH_REFRESH_INTERVAL seconds"""
+    while True:
+        app.state.health_bytes = render_health()
+        await asyncio.sleep(HEALTH_REFRESH_INTERVAL)
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return Response(content=app.state.health_bytes or render_health(), media_type="application/json")
 
 @app.get("/logs")
 async def get_service_logs():
@@ -359,26 +973,61 @@ async def get_service_logs():
         # This would read from the service's log file if it exists
         log_file = "portfolio_service.log"
         if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-            return {"logs": lines[-50:]}  # Last 50 lines
+            lines = await asyncio.to_thread(read_log_tail, log_file, 50)
+            return {"logs": lines}  # Last 50 lines
         else:
             return {"logs": ["No log file found"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve logs: {str(e)}")
 
+@app.on_event("startup")
+async def startup_event():
+    """Prepare and start watching the audit log when FastAPI starts"""
+    app.state.health_bytes = render_health()
+    app.state.health_task = asyncio.create_task(update_health_bytes())
+    
+    await asyncio.to_thread(preallocate_audit_log, get_audit_log_path())
+    
+    observer = Observer()
+    observer.start()
+    app.state.audit_observer = observer
+    await watch_audit_log()
+
 # Cleanup on shutdown
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up when FastAPI shuts down"""
-    stop_project_service()
+    # Each worker only stops the service it spawned itself
+    await stop_project_service(app, own_only=True)
+    
+    health_task = app.state.health_task
+    if health_task is not None:
+        app.state.health_task = None
+        health_task.cancel()
+    
+    observer = app.state.audit_observer
+    if observer is not None:
+        app.state.audit_observer = None
+        observer.stop()
+        observer.join()
 
 # Run the FastAPI server
 if __name__ == "__main__":
+    # DEV=1 keeps the auto-reloading single-process setup for development
+    dev_mode = bool(os.getenv("DEV"))
+    
+    # uvloop and httptools come with uvicorn[standard]; without them (and for
+    # uvloop on Windows) let uvicorn fall back to its pure-Python defaults
+    has_uvloop = sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None
+    has_httptools = importlib.util.find_spec("httptools") is not None
+    
     uvicorn.run(
         "api_server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        loop="uvloop" if has_uvloop else "auto",
+        http="httptools" if has_httptools else "auto",
+        workers=1 if dev_mode else max(1, (os.cpu_count() or 2) // 2),
+        reload=dev_mode,
+        log_level="info" if dev_mode else "warning"
     )
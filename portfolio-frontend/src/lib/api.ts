@@ -77,7 +77,7 @@ export const portfolioAPI = {
 
   // Get audit log
   getAuditLog: async (limit: number = 10): Promise<{ records: AuditRecord[] }> => {
-    const response = await apiClient.get(`/audit-log?limit=${limit}`);
+    const response = await apiClient.get(`/audit-log?limit=${limit}&format=json`);
     return response.data;
   },
 
@@ -58,12 +58,15 @@ The service will start and begin the rebalancing loop based on configured interv
 
 import argparse
 import asyncio
+import ctypes
 import hashlib
 import hmac
 import json
 import logging
 import os
+import signal
 import ssl
+import struct
 import sys
 import time
 from datetime import datetime, timezone
@@ -160,6 +163,39 @@ def setup_logging(level: str = 'INFO'):
 
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# PROCESS SUPERVISION - Handshake with the managing API server
+# ============================================================================
+PR_SET_PDEATHSIG = 1                    # prctl option: signal on parent death
+
+def _bind_lifetime_to_parent():
+    """Exit together with the API server that started us (Linux only)."""
+    parent_pid = os.getenv('PORTFOLIO_PARENT_PID')
+    if not parent_pid or not sys.platform.startswith('linux'):
+        return
+        
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.prctl(PR_SET_PDEATHSIG, signal.SIGTERM) != 0:
+        logger.warning(f"prctl(PR_SET_PDEATHSIG) failed: {os.strerror(ctypes.get_errno())}")
+        return
+        
+    # A parent that died before the prctl call would never deliver the signal
+    if os.getppid() != int(parent_pid):
+        logger.error("Managing API server exited during startup; shutting down")
+        sys.exit(1)
+
+def _signal_ready():
+    """Tell the managing API server that startup succeeded."""
+    ready_file = os.getenv('PORTFOLIO_READY_FILE')
+    if not ready_file:
+        return
+        
+    # Write via rename so the API server never reads a partial PID
+    tmp_file = f"{ready_file}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w') as f:
+        f.write(str(os.getpid()))
+    os.replace(tmp_file, ready_file)
+
 # ============================================================================
 # CONFIGURATION CLASSES
 # ============================================================================
@@ -241,10 +277,18 @@ class ConfigWatcher(FileSystemEventHandler):
         
     def on_modified(self, event):
         if event.src_path.endswith('config.json'):
-            current_time = _time.now()
-            if current_time - self.last_modified > DEBOUNCE_SECONDS:
-                self.last_modified = current_time
-                self.callback()
+            self._trigger()
+            
+    def on_moved(self, event):
+        # The API server replaces config.json atomically via a rename
+        if event.dest_path.endswith('config.json'):
+            self._trigger()
+            
+    def _trigger(self):
+        current_time = _time.now()
+        if current_time - self.last_modified > DEBOUNCE_SECONDS:
+            self.last_modified = current_time
+            self.callback()
 
 # ============================================================================
 # SECURE API CLIENT WITH RETRY LOGIC
@@ -524,6 +568,31 @@ class PortfolioOptimizer:
 # ============================================================================
 # AUDIT LOGGER WITH PROPER RESOURCE MANAGEMENT
 # ============================================================================
+class IndexedFileHandler(logging.FileHandler):
+    """File handler that appends each record's end offset to a `<log>.idx` sidecar."""
+    
+    def __init__(self, filename, mode='a', encoding=None, delay=False):
+        super().__init__(filename, mode, encoding, delay)
+        self._index = open(f"{self.baseFilename}.idx", 'ab')
+        
+    def emit(self, record):
+        super().emit(record)
+        try:
+            if self.stream is not None:
+                self._index.write(struct.pack('<Q', self.stream.tell()))
+                self._index.flush()
+        except Exception:
+            self.handleError(record)
+            
+    def close(self):
+        self.acquire()
+        try:
+            if not self._index.closed:
+                self._index.close()
+        finally:
+            self.release()
+        super().close()
+
 class AuditLogger:
     """SOC 2 compliant audit logger for portfolio decisions."""
     
@@ -539,7 +608,7 @@ class AuditLogger:
         self.audit_logger.setLevel(logging.INFO)
         
         # Create audit log handler with daily rotation
-        self._file_handler = logging.FileHandler(
+        self._file_handler = IndexedFileHandler(
             self.log_directory / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
         )
         audit_formatter = logging.Formatter(
@@ -739,6 +808,9 @@ class PortfolioService:
         self.running = True
         
         async with SecureAPIClient(test_mode=self.test_mode) as api_client:
+            # Credentials and the HTTP session are in place; report readiness
+            _signal_ready()
+            
             try:
                 while self.running:
                     loop_start = _time.now()
@@ -833,6 +905,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    _bind_lifetime_to_parent()
+    
     # Use CLI interface if available, otherwise fall back to main()
     try:
         exit_code = cli()
@@ -0,0 +1,34 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Make the top-level api_server module importable from the tests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_server  # noqa: E402
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Shrink the reverse-read block size so tests cross block boundaries"""
+    monkeypatch.setattr(api_server, "TAIL_CHUNK_SIZE", 16)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty directory with api_server's caches and app state reset"""
+    monkeypatch.chdir(tmp_path)
+    api_server._cached_config_mtime_tuple.cache_clear()
+    api_server._LATEST_CACHE.clear()
+    api_server._PROC_CACHE.clear()
+    api_server.invalidate_status_cache()
+    # asyncio.Lock binds to the first loop that waits on it; each test runs its own
+    monkeypatch.setattr(api_server, "_STATUS_LOCK", asyncio.Lock())
+    api_server.app.state.latest_record = None
+    api_server.app.state.watched_audit_file = None
+    api_server.app.state.child_proc = None
+    yield tmp_path
+    api_server._cached_config_mtime_tuple.cache_clear()
+    api_server.invalidate_status_cache()
@@ -0,0 +1,27 @@
+"""Shared helpers for building audit logs in tests"""
+
+import json
+
+import api_server
+
+
+def write_log(path, records, trailing_newline=True):
+    """Write one JSON line per record and return the end offset of each line"""
+    data = b""
+    offsets = []
+    for record in records:
+        data += json.dumps(record).encode() + b"\n"
+        offsets.append(len(data))
+    if not trailing_newline:
+        data = data[:-1]
+        offsets[-1] -= 1
+    path.write_bytes(data)
+    return offsets
+
+
+def tail_ids(path, limit):
+    return [record["i"] for record in api_server._tail_json_lines(str(path), limit)]
+
+
+def expected_ids(total, limit):
+    return list(range(total - 1, max(total - limit, 0) - 1, -1))
@@ -0,0 +1,83 @@
+"""Tests for the atomic, owner-only writes of .env and config.json"""
+
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+import api_server
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+
+
+def test_writes_and_replaces(workdir):
+    api_server._atomic_write("out.txt", b"old")
+    api_server._atomic_write("out.txt", b"new")
+
+    assert (workdir / "out.txt").read_bytes() == b"new"
+    assert os.listdir(workdir) == ["out.txt"]
+
+
+@posix_only
+def test_owner_only_mode(workdir):
+    (workdir / "out.txt").write_text("world readable")
+    os.chmod(workdir / "out.txt", 0o644)
+
+    api_server._atomic_write("out.txt", b"secret")
+
+    assert os.stat(workdir / "out.txt").st_mode & 0o777 == 0o600
+
+
+def test_short_writes_are_completed(workdir, monkeypatch):
+    real_write = os.write
+    monkeypatch.setattr(api_server.os, "write", lambda fd, data: real_write(fd, bytes(data[:3])))
+
+    api_server._atomic_write("out.txt", b"0123456789")
+
+    assert (workdir / "out.txt").read_bytes() == b"0123456789"
+
+
+def test_failure_keeps_old_file_and_removes_temp(workdir, monkeypatch):
+    (workdir / "out.txt").write_bytes(b"old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(api_server.os, "replace", fail)
+
+    with pytest.raises(OSError):
+        api_server._atomic_write("out.txt", b"new")
+
+    assert (workdir / "out.txt").read_bytes() == b"old"
+    assert os.listdir(workdir) == ["out.txt"]
+
+
+def test_concurrent_writers(workdir):
+    threads = [
+        threading.Thread(target=api_server._atomic_write, args=("out.txt", str(i).encode() * 100_000))
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The winner's content is intact, never a mix of writers
+    assert len(set((workdir / "out.txt").read_bytes())) == 1
+    assert os.listdir(workdir) == ["out.txt"]
+
+
+def test_config_files(workdir):
+    config = api_server.ConfigurationRequest(
+        api_base_url="https://example.com", api_key="key", audit_log_path="custom.log"
+    )
+
+    api_server.create_env_file(config)
+    api_server.create_config_file(config)
+
+    assert (workdir / ".env").read_text() == "API_URL=https://example.com\nAPI_TOKEN=key\n"
+    with open(workdir / "config.json") as f:
+        assert json.load(f)["audit_log_path"] == "custom.log"
+    assert api_server.get_audit_log_path() == "custom.log"
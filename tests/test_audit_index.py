@@ -0,0 +1,108 @@
+"""Tests for the audit log `.idx` offset sidecar: project.py writes it, api_server reads it"""
+
+import logging
+import struct
+
+import pytest
+
+import api_server
+from helpers import expected_ids, tail_ids, write_log
+
+
+def write_index(path, offsets):
+    path.with_name(path.name + ".idx").write_bytes(
+        b"".join(struct.pack("<Q", offset) for offset in offsets)
+    )
+
+
+def read_index(path):
+    data = path.with_name(path.name + ".idx").read_bytes()
+    return list(struct.unpack(f"<{len(data) // 8}Q", data))
+
+
+class TestTailLinesIndexed:
+    def test_full_index(self, tmp_path, small_chunks):
+        log = tmp_path / "audit.log"
+        write_index(log, write_log(log, [{"i": i} for i in range(20)]))
+
+        assert api_server._tail_lines_indexed(str(log), 5) is not None
+        for limit in (1, 5, 19, 20, 100):
+            assert tail_ids(log, limit) == expected_ids(20, limit)
+
+    def test_missing_index_falls_back(self, tmp_path):
+        log = tmp_path / "audit.log"
+        write_log(log, [{"i": i} for i in range(5)])
+
+        assert api_server._tail_lines_indexed(str(log), 5) is None
+        assert tail_ids(log, 5) == expected_ids(5, 5)
+
+    def test_partial_index_falls_back(self, tmp_path):
+        # The index was only started once the log already held 150 lines
+        log = tmp_path / "audit.log"
+        offsets = write_log(log, [{"i": i} for i in range(200)])
+        write_index(log, offsets[150:])
+
+        assert api_server._tail_lines_indexed(str(log), 100) is None
+        assert tail_ids(log, 100) == expected_ids(200, 100)
+        assert len(list(api_server._stream_reverse_lines(str(log), 100))) == 100
+
+    def test_partial_index_within_limit(self, tmp_path):
+        log = tmp_path / "audit.log"
+        offsets = write_log(log, [{"i": i} for i in range(200)])
+        write_index(log, offsets[150:])
+
+        assert tail_ids(log, 20) == expected_ids(200, 20)
+
+    def test_lagging_index_falls_back(self, tmp_path):
+        log = tmp_path / "audit.log"
+        write_index(log, write_log(log, [{"i": i} for i in range(10)]))
+        with open(log, "ab") as f:
+            f.write(b'{"i": 10}\n')
+
+        assert api_server._tail_lines_indexed(str(log), 3) is None
+        assert tail_ids(log, 3) == [10, 9, 8]
+
+    def test_lost_middle_entry(self, tmp_path):
+        log = tmp_path / "audit.log"
+        offsets = write_log(log, [{"i": i} for i in range(10)])
+        write_index(log, offsets[:4] + offsets[5:])
+
+        assert tail_ids(log, 10) == expected_ids(10, 10)
+
+
+class TestIndexedFileHandler:
+    @pytest.fixture
+    def project(self):
+        # project.py pulls in the optimizer stack (numpy, pandas, PyPortfolioOpt)
+        return pytest.importorskip("project")
+
+    def log_records(self, project, path, count, start=0):
+        handler = project.IndexedFileHandler(path)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.getLogger(f"test_audit_index.{path}")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            for i in range(start, start + count):
+                logger.warning('{"i": %d}', i)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+    def test_one_offset_per_record(self, project, tmp_path):
+        log = tmp_path / "audit.log"
+        self.log_records(project, log, 5)
+
+        offsets = read_index(log)
+        assert len(offsets) == 5
+        assert offsets[-1] == log.stat().st_size
+        assert log.read_bytes()[: offsets[0]] == b'{"i": 0}\n'
+
+    def test_reader_uses_writer_index(self, project, tmp_path):
+        log = tmp_path / "audit.log"
+        self.log_records(project, log, 10)
+        # Reopening appends to both the log and its index
+        self.log_records(project, log, 10, start=10)
+
+        assert api_server._tail_lines_indexed(str(log), 5) is not None
+        assert tail_ids(log, 15) == expected_ids(20, 15)
@@ -0,0 +1,82 @@
+"""Tests for /audit-log's NDJSON stream and its `format=json` envelope"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api_server
+
+
+@pytest.fixture
+def client(workdir):
+    # Lifespan events are not needed here, so the client is not entered
+    return TestClient(api_server.app)
+
+
+@pytest.fixture
+def audit_log(workdir):
+    path = workdir / "audit.log"
+    # Raw lines with spacing and key order that re-serialization would change
+    path.write_bytes(
+        b'{"timestamp": "t0",  "i": 0}\n'
+        b'{"timestamp": "t1",  "i": 1}\r\n'
+        b'{"timestamp": "t2",  "i": 2}\n'
+    )
+    return path
+
+
+class TestNdjson:
+    def test_default_streams_raw_lines_newest_first(self, client, audit_log):
+        response = client.get("/audit-log")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.content == (
+            b'{"timestamp": "t2",  "i": 2}\n'
+            b'{"timestamp": "t1",  "i": 1}\n'
+            b'{"timestamp": "t0",  "i": 0}\n'
+        )
+
+    def test_limit(self, client, audit_log):
+        response = client.get("/audit-log", params={"limit": 2})
+
+        assert [json.loads(line)["i"] for line in response.text.splitlines()] == [2, 1]
+
+    def test_missing_log(self, client, workdir):
+        response = client.get("/audit-log")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.content == b""
+
+
+class TestJson:
+    def test_parsed_records_newest_first(self, client, audit_log):
+        response = client.get("/audit-log", params={"format": "json"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert [record["i"] for record in response.json()["records"]] == [2, 1, 0]
+
+    def test_invalid_lines_skipped(self, client, audit_log):
+        with open(audit_log, "ab") as f:
+            f.write(b"not json\n")
+
+        response = client.get("/audit-log", params={"format": "json"})
+
+        assert [record["i"] for record in response.json()["records"]] == [2, 1, 0]
+
+    def test_limit(self, client, audit_log):
+        response = client.get("/audit-log", params={"format": "json", "limit": 1})
+
+        assert response.json() == {"records": [{"timestamp": "t2", "i": 2}]}
+
+    def test_missing_log(self, client, workdir):
+        response = client.get("/audit-log", params={"format": "json"})
+
+        assert response.json() == {"records": []}
+
+
+def test_unknown_format_is_rejected(client, audit_log):
+    assert client.get("/audit-log", params={"format": "xml"}).status_code == 422
@@ -0,0 +1,67 @@
+"""Tests for tracking the project.py child across requests and workers"""
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+import api_server
+
+
+def exited_child():
+    return SimpleNamespace(pid=999999, returncode=1)
+
+
+def write_service_files(pid, ready=True):
+    with open(api_server.project_pid_file, "w") as f:
+        f.write(str(pid))
+    if ready:
+        with open(api_server.project_ready_file, "w") as f:
+            f.write(str(pid))
+
+
+class TestStopProjectService:
+    def test_clears_crashed_child(self, workdir):
+        api_server.app.state.child_proc = exited_child()
+
+        assert asyncio.run(api_server.stop_project_service(api_server.app))
+        assert api_server.app.state.child_proc is None
+
+    def test_own_only_leaves_other_workers_service(self, workdir):
+        # The PID file names a live process this worker did not spawn
+        write_service_files(os.getpid())
+
+        assert asyncio.run(api_server.stop_project_service(api_server.app, own_only=True))
+        assert os.path.exists(api_server.project_pid_file)
+
+
+class TestStartProjectService:
+    def test_returns_none_while_another_start_holds_the_lock(self, workdir):
+        with api_server._start_lock() as acquired:
+            assert acquired
+            assert asyncio.run(api_server.start_project_service(api_server.app)) is None
+
+
+class TestWaitForProjectStart:
+    def test_ignores_stale_child_when_another_request_started(self, workdir):
+        # An exited child from an earlier attempt is still attached, while
+        # another request's start (here: this test process) reports ready
+        api_server.app.state.child_proc = exited_child()
+        write_service_files(os.getpid())
+
+        running, pid = asyncio.run(api_server.wait_for_project_start(api_server.app, None, timeout=1.0))
+
+        assert running
+        assert pid == os.getpid()
+
+    def test_fails_fast_when_own_child_exited(self, workdir):
+        write_service_files(os.getpid(), ready=False)
+
+        async def wait():
+            start = asyncio.get_running_loop().time()
+            result = await api_server.wait_for_project_start(api_server.app, exited_child(), timeout=5.0)
+            return result, asyncio.get_running_loop().time() - start
+
+        (running, pid), elapsed = asyncio.run(wait())
+
+        assert not running
+        assert elapsed < 1.0
@@ -0,0 +1,51 @@
+"""Tests for the preformatted /health payload"""
+
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+import api_server
+
+
+def test_serves_cached_payload(workdir):
+    with TestClient(api_server.app) as client:
+        response = client.get("/health")
+        cached = api_server.app.state.health_bytes
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == cached
+    assert json.loads(response.content)["status"] == "healthy"
+
+
+def test_payload_is_refreshed(workdir, monkeypatch):
+    monkeypatch.setattr(api_server, "HEALTH_REFRESH_INTERVAL", 0.01)
+
+    with TestClient(api_server.app) as client:
+        first = client.get("/health").json()["timestamp"]
+        deadline = time.monotonic() + 5
+        while client.get("/health").json()["timestamp"] == first and time.monotonic() < deadline:
+            time.sleep(0.02)
+        second = client.get("/health").json()["timestamp"]
+
+    assert second > first
+
+
+def test_refresh_task_stops_on_shutdown(workdir):
+    with TestClient(api_server.app):
+        task = api_server.app.state.health_task
+        assert not task.done()
+
+    assert api_server.app.state.health_task is None
+    assert task.done()
+
+
+def test_renders_on_demand_before_startup(workdir, monkeypatch):
+    monkeypatch.setattr(api_server.app.state, "health_bytes", None)
+
+    # Without entering the client the startup hook never runs
+    response = TestClient(api_server.app).get("/health")
+
+    assert response.status_code == 200
+    assert json.loads(response.content)["status"] == "healthy"
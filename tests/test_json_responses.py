@@ -0,0 +1,42 @@
+"""Tests that JSON endpoints serialize without the deprecated ORJSONResponse"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api_server
+
+pytestmark = pytest.mark.filterwarnings("error:ORJSONResponse is deprecated")
+
+
+@pytest.fixture
+def client(workdir):
+    with open(workdir / "audit.log", "w") as f:
+        for i in range(3):
+            f.write(json.dumps({"i": i, "timestamp": f"t{i}"}) + "\n")
+    with TestClient(api_server.app) as client:
+        yield client
+
+
+def test_status(client):
+    response = client.get("/status")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["last_rebalance"] == "t2"
+
+
+def test_audit_log_json(client):
+    response = client.get("/audit-log", params={"format": "json", "limit": 2})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"records": [{"i": 2, "timestamp": "t2"}, {"i": 1, "timestamp": "t1"}]}
+
+
+def test_plain_dict_endpoint(client):
+    response = client.get("/logs")
+
+    assert response.status_code == 200
+    assert response.json() == {"logs": ["No log file found"]}
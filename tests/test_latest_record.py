@@ -0,0 +1,96 @@
+"""Tests for the in-memory latest audit record and the config it depends on"""
+
+import json
+import os
+import time
+
+from fastapi.testclient import TestClient
+
+import api_server
+
+
+def append_record(path, record):
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def write_config(path, text):
+    path.write_text(text)
+    # Make sure the mtime-keyed config cache sees every rewrite
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class TestAuditLogPath:
+    def test_missing_config(self, workdir):
+        assert api_server.get_audit_log_path() == "audit.log"
+
+    def test_configured_path(self, workdir):
+        write_config(workdir / "config.json", '{"audit_log_path": "custom.log"}')
+
+        assert api_server.get_audit_log_path() == "custom.log"
+
+    def test_malformed_config(self, workdir):
+        write_config(workdir / "config.json", "{not json")
+
+        assert api_server.get_audit_log_path() == "audit.log"
+
+    def test_null_and_non_string_path(self, workdir):
+        write_config(workdir / "config.json", '{"audit_log_path": null}')
+        assert api_server.get_audit_log_path() == "audit.log"
+
+        write_config(workdir / "config.json", '{"audit_log_path": 5}')
+        assert api_server.get_audit_log_path() == "audit.log"
+
+    def test_non_object_config(self, workdir):
+        write_config(workdir / "config.json", "[]")
+
+        assert api_server.get_audit_log_path() == "audit.log"
+
+
+class TestLatestRecord:
+    def test_watcher_picks_up_new_records(self, workdir):
+        append_record(workdir / "audit.log", {"timestamp": "t1"})
+
+        with TestClient(api_server.app) as client:
+            assert api_server.app.state.latest_record == {"timestamp": "t1"}
+
+            append_record(workdir / "audit.log", {"timestamp": "t2"})
+            assert wait_for(lambda: api_server.app.state.latest_record == {"timestamp": "t2"})
+
+            api_server.invalidate_status_cache()
+            assert client.get("/status").json()["last_rebalance"] == "t2"
+
+    def test_startup_with_malformed_config(self, workdir):
+        write_config(workdir / "config.json", "{not json")
+        append_record(workdir / "audit.log", {"timestamp": "t1"})
+
+        with TestClient(api_server.app) as client:
+            response = client.get("/status")
+
+        assert response.status_code == 200
+        assert response.json()["last_rebalance"] == "t1"
+
+    def test_config_broken_while_running(self, workdir):
+        write_config(workdir / "config.json", '{"audit_log_path": "custom.log"}')
+        append_record(workdir / "custom.log", {"timestamp": "custom"})
+        append_record(workdir / "audit.log", {"timestamp": "default"})
+
+        with TestClient(api_server.app) as client:
+            assert client.get("/status").json()["last_rebalance"] == "custom"
+
+            write_config(workdir / "config.json", "{not json")
+            api_server.invalidate_status_cache()
+            response = client.get("/status")
+
+        assert response.status_code == 200
+        assert response.json()["last_rebalance"] == "default"
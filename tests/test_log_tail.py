@@ -0,0 +1,70 @@
+"""Tests for the memory-mapped service log tail behind /logs"""
+
+import asyncio
+
+import api_server
+
+
+class TestReadLogTail:
+    # Lines keep their newline, as readlines() did before the tail reader
+    def test_last_lines(self, tmp_path):
+        log = tmp_path / "service.log"
+        log.write_text("".join(f"line {i}\n" for i in range(100)))
+
+        assert api_server.read_log_tail(str(log), 3) == ["line 97\n", "line 98\n", "line 99\n"]
+
+    def test_no_trailing_newline(self, tmp_path):
+        log = tmp_path / "service.log"
+        log.write_text("a\nb\nc")
+
+        assert api_server.read_log_tail(str(log), 2) == ["b\n", "c"]
+
+    def test_count_larger_than_file(self, tmp_path):
+        log = tmp_path / "service.log"
+        log.write_text("a\nb\n")
+
+        assert api_server.read_log_tail(str(log), 50) == ["a\n", "b\n"]
+
+    def test_zero_count(self, tmp_path):
+        log = tmp_path / "service.log"
+        log.write_text("a\nb\n")
+
+        assert api_server.read_log_tail(str(log), 0) == []
+
+    def test_invalid_utf8_is_replaced(self, tmp_path):
+        log = tmp_path / "service.log"
+        log.write_bytes(b"ok\nbad \xff\n")
+
+        assert api_server.read_log_tail(str(log), 1) == ["bad \ufffd\n"]
+
+    def test_empty_file(self, tmp_path):
+        log = tmp_path / "service.log"
+        log.write_bytes(b"")
+
+        assert api_server.read_log_tail(str(log), 50) == []
+
+
+class TestLogsEndpoint:
+    def get_logs(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        return asyncio.run(api_server.get_service_logs())["logs"]
+
+    def test_missing_log(self, tmp_path, monkeypatch):
+        assert self.get_logs(tmp_path, monkeypatch) == ["No log file found"]
+
+    def test_empty_log(self, tmp_path, monkeypatch):
+        (tmp_path / "portfolio_service.log").write_bytes(b"")
+
+        assert self.get_logs(tmp_path, monkeypatch) == []
+
+    def test_returns_last_50_lines(self, tmp_path, monkeypatch):
+        lines = [f"line {i}\n" for i in range(120)]
+        (tmp_path / "portfolio_service.log").write_text("".join(lines))
+
+        assert self.get_logs(tmp_path, monkeypatch) == lines[-50:]
+
+    def test_exactly_50_lines(self, tmp_path, monkeypatch):
+        lines = [f"line {i}\n" for i in range(50)]
+        (tmp_path / "portfolio_service.log").write_text("".join(lines))
+
+        assert self.get_logs(tmp_path, monkeypatch) == lines
@@ -0,0 +1,134 @@
+"""Tests for waking on the ready file and tying project.py's lifetime to the API server"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+
+import api_server
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify/prctl are Linux-only")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stand-in for project.py that records the environment it was started with
+ENV_PROJECT = """
+import os, time
+with open("child_env.txt", "w") as f:
+    f.write(os.environ["PORTFOLIO_PARENT_PID"] + "\\n" + os.environ["PORTFOLIO_READY_FILE"])
+time.sleep(60)
+"""
+
+
+def write_ready_file(pid):
+    with open(api_server.project_ready_file + ".tmp", "w") as f:
+        f.write(str(pid))
+    os.replace(api_server.project_ready_file + ".tmp", api_server.project_ready_file)
+
+
+@linux_only
+class TestWatchReadyFile:
+    def test_wakes_when_ready_file_is_written(self, workdir):
+        async def run():
+            loop = asyncio.get_running_loop()
+            with api_server._watch_ready_file() as wait:
+                loop.call_later(0.1, write_ready_file, os.getpid())
+                start = loop.time()
+                await wait(5.0)
+                return loop.time() - start
+
+        assert asyncio.run(run()) < 2.0
+
+    def test_times_out_without_a_write(self, workdir):
+        async def run():
+            loop = asyncio.get_running_loop()
+            with api_server._watch_ready_file() as wait:
+                start = loop.time()
+                await wait(0.2)
+                return loop.time() - start
+
+        assert 0.15 <= asyncio.run(run()) < 2.0
+
+
+def test_child_gets_parent_pid_and_ready_file(workdir):
+    (workdir / "project.py").write_text(ENV_PROJECT)
+
+    async def run():
+        await api_server.start_project_service(api_server.app)
+        try:
+            deadline = time.monotonic() + 10
+            while not (workdir / "child_env.txt").exists() and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+        finally:
+            await api_server.stop_project_service(api_server.app)
+
+    asyncio.run(run())
+
+    parent_pid, ready_file = (workdir / "child_env.txt").read_text().split("\n")
+    assert int(parent_pid) == os.getpid()
+    assert ready_file == os.path.abspath(api_server.project_ready_file)
+
+
+@linux_only
+class TestBindLifetimeToParent:
+    @pytest.fixture(autouse=True)
+    def project(self):
+        # project.py pulls in the optimizer stack (numpy, pandas, PyPortfolioOpt)
+        return pytest.importorskip("project")
+
+    def run_bound(self, parent_pid, code="print('alive')"):
+        return subprocess.run(
+            [sys.executable, "-c", f"import project; project._bind_lifetime_to_parent(); {code}"],
+            env={**os.environ, "PYTHONPATH": REPO_ROOT, "PORTFOLIO_PARENT_PID": str(parent_pid)},
+            capture_output=True, text=True, timeout=60,
+        )
+
+    def test_keeps_running_under_its_parent(self):
+        result = self.run_bound(os.getpid())
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == "alive"
+
+    def test_exits_when_parent_already_gone(self):
+        # Simulates the API server dying before the prctl call: getppid()
+        # no longer matches the PID it was started with
+        result = self.run_bound(os.getpid() + 1_000_000)
+
+        assert result.returncode == 1
+        assert "alive" not in result.stdout
+
+    def test_terminated_when_parent_dies(self, tmp_path):
+        # The intermediate process plays the API server: it starts a bound
+        # child, reports its PID and exits without stopping it
+        child = (
+            "import os, subprocess, sys; "
+            "p = subprocess.Popen([sys.executable, '-c', "
+            "'import project, time; project._bind_lifetime_to_parent(); time.sleep(60)'], "
+            "env={**os.environ, 'PORTFOLIO_PARENT_PID': str(os.getpid())}); "
+            "print(p.pid, flush=True); "
+            "import time; time.sleep(5)"
+        )
+        parent = subprocess.Popen(
+            [sys.executable, "-c", child],
+            env={**os.environ, "PYTHONPATH": REPO_ROOT},
+            stdout=subprocess.PIPE, text=True,
+        )
+        child_pid = int(parent.stdout.readline())
+        parent.kill()
+        parent.wait()
+
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                if psutil.Process(child_pid).status() == psutil.STATUS_ZOMBIE:
+                    break
+            except psutil.NoSuchProcess:
+                break
+            time.sleep(0.1)
+        else:
+            psutil.Process(child_pid).kill()
+            pytest.fail("child outlived its parent")
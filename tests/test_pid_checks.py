@@ -0,0 +1,114 @@
+"""Tests for the signal-0 liveness probe and the project.py identity check"""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+import api_server
+
+
+@pytest.fixture
+def sleeper():
+    """A live process that is not project.py"""
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    yield process
+    process.kill()
+    process.wait()
+
+
+@pytest.fixture
+def fake_project(workdir):
+    """A live process whose command line is `python project.py`"""
+    (workdir / "project.py").write_text("import time; time.sleep(60)")
+    process = subprocess.Popen([sys.executable, "project.py"])
+    yield process
+    process.kill()
+    process.wait()
+
+
+def write_pid_file(pid):
+    with open(api_server.project_pid_file, "w") as f:
+        f.write(str(pid))
+
+
+class TestPidAlive:
+    def test_live_process(self):
+        assert api_server._pid_alive(os.getpid())
+
+    def test_exited_process(self):
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+
+        assert not api_server._pid_alive(process.pid)
+
+    @pytest.mark.parametrize("pid", [0, -1])
+    def test_invalid_pid(self, pid):
+        assert not api_server._pid_alive(pid)
+
+    @pytest.mark.skipif(os.name == "nt", reason="signal 0 is not used on Windows")
+    def test_other_users_process_is_stale(self, monkeypatch):
+        def kill(pid, sig):
+            raise PermissionError
+
+        monkeypatch.setattr(api_server.os, "kill", kill)
+
+        assert not api_server._pid_alive(os.getpid())
+
+
+class TestIsProjectProcess:
+    def test_project_process(self, fake_project):
+        assert api_server._is_project_process(fake_project.pid)
+
+    def test_unrelated_process(self, sleeper):
+        assert not api_server._is_project_process(sleeper.pid)
+
+    def test_missing_process(self):
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+
+        assert not api_server._is_project_process(process.pid)
+
+
+class TestIsProjectRunning:
+    def test_no_pid_file(self, workdir):
+        assert api_server.is_project_running() == (False, None)
+
+    def test_live_pid(self, workdir, sleeper):
+        write_pid_file(sleeper.pid)
+
+        assert api_server.is_project_running() == (True, sleeper.pid)
+
+    def test_stale_pid(self, workdir):
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        write_pid_file(process.pid)
+
+        assert api_server.is_project_running() == (False, None)
+
+    def test_garbage_pid_file(self, workdir):
+        (workdir / api_server.project_pid_file).write_text("not a pid")
+
+        assert api_server.is_project_running() == (False, None)
+
+
+class TestStopNonChild:
+    def test_reused_pid_is_left_alone(self, workdir, sleeper):
+        # The PID file points at a live process that is not project.py
+        write_pid_file(sleeper.pid)
+
+        assert asyncio.run(api_server.stop_project_service(api_server.app))
+
+        assert sleeper.poll() is None
+        assert not os.path.exists(api_server.project_pid_file)
+
+    def test_other_instances_service_is_stopped(self, workdir, fake_project):
+        # Started by another worker, so it is not this worker's child
+        write_pid_file(fake_project.pid)
+
+        assert asyncio.run(api_server.stop_project_service(api_server.app))
+
+        assert fake_project.wait(timeout=10) is not None
+        assert not os.path.exists(api_server.project_pid_file)
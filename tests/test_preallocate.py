@@ -0,0 +1,57 @@
+"""Tests for audit log preallocation and the audit_log_path it is given"""
+
+import json
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api_server
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fallocate is Linux-only")
+
+CONFIG = {"api_base_url": "https://example.com", "api_key": "key"}
+
+
+@linux_only
+class TestPreallocateAuditLog:
+    def test_creates_empty_log(self, workdir):
+        api_server.preallocate_audit_log("audit.log")
+
+        assert os.path.getsize("audit.log") == 0
+        assert os.stat("audit.log").st_mode & 0o777 == 0o600
+
+    def test_keeps_existing_content(self, workdir):
+        (workdir / "audit.log").write_bytes(b'{"i": 0}\n')
+
+        api_server.preallocate_audit_log("audit.log")
+        api_server.preallocate_audit_log("audit.log")
+
+        assert (workdir / "audit.log").read_bytes() == b'{"i": 0}\n'
+
+    @pytest.mark.parametrize("audit_file", [None, "missing_dir/audit.log", ""])
+    def test_bad_path_is_ignored(self, workdir, audit_file):
+        api_server.preallocate_audit_log(audit_file)
+
+
+class TestAuditLogPathRequest:
+    @pytest.mark.parametrize("audit_log_path", [None, "", "   "])
+    def test_blank_path_uses_default(self, audit_log_path):
+        config = api_server.ConfigurationRequest(**CONFIG, audit_log_path=audit_log_path)
+
+        assert config.audit_log_path == "audit.log"
+
+    def test_configure_with_null_path(self, workdir):
+        # No project.py in the working directory, so the start itself fails
+        with TestClient(api_server.app) as client:
+            response = client.post("/configure", json={**CONFIG, "audit_log_path": None})
+        assert response.status_code == 400
+        assert "failed to start" in response.json()["detail"]
+
+        with open("config.json") as f:
+            assert json.load(f)["audit_log_path"] == "audit.log"
+
+        # The saved config must not keep the next server start from succeeding
+        with TestClient(api_server.app) as client:
+            assert client.get("/status").status_code == 200
@@ -0,0 +1,113 @@
+"""Tests for starting and stopping project.py through the ready-file handshake"""
+
+import asyncio
+import os
+
+import pytest
+
+import api_server
+
+# Stand-in for project.py: optionally stalls or fails, then reports ready
+# the same way project.py does and keeps running until terminated
+FAKE_PROJECT = """
+import os, sys, time
+time.sleep(float(os.environ.get("FAKE_DELAY", "0")))
+if os.environ.get("FAKE_EXIT"):
+    sys.exit(1)
+# Log chatter on stderr, as project.py's StreamHandler produces
+for _ in range(int(os.environ.get("FAKE_STDERR_KB", "0"))):
+    sys.stderr.write("x" * 1023 + "\\n")
+sys.stderr.flush()
+ready = os.environ["PORTFOLIO_READY_FILE"]
+with open(ready + ".tmp", "w") as f:
+    f.write(str(os.getpid()))
+os.replace(ready + ".tmp", ready)
+time.sleep(60)
+"""
+
+
+@pytest.fixture
+def fake_project(workdir):
+    (workdir / "project.py").write_text(FAKE_PROJECT)
+    return workdir
+
+
+async def start_and_wait(timeout):
+    process = await api_server.start_project_service(api_server.app)
+    try:
+        running, pid = await api_server.wait_for_project_start(api_server.app, process, timeout=timeout)
+        return process, running, pid, os.path.exists(api_server.project_pid_file)
+    finally:
+        await api_server.stop_project_service(api_server.app)
+
+
+def test_ready_handshake(fake_project):
+    process, running, pid, _ = asyncio.run(start_and_wait(timeout=10.0))
+
+    assert running
+    assert pid == process.pid
+    assert process.returncode is not None  # stopped again by the helper
+    assert not os.path.exists(api_server.project_pid_file)
+    assert not os.path.exists(api_server.project_ready_file)
+
+
+def test_chatty_child_does_not_block(fake_project, monkeypatch):
+    # Far more than a pipe buffer plus asyncio's StreamReader limit
+    monkeypatch.setenv("FAKE_STDERR_KB", "1024")
+
+    _, running, _, _ = asyncio.run(start_and_wait(timeout=10.0))
+
+    assert running
+
+
+def test_child_exiting_early_fails_fast(fake_project, monkeypatch):
+    monkeypatch.setenv("FAKE_EXIT", "1")
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await start_and_wait(timeout=10.0)
+        return result, loop.time() - start
+
+    (process, running, pid, _), elapsed = asyncio.run(run())
+
+    assert not running
+    assert pid is None
+    assert process.returncode == 1
+    assert elapsed < 5.0
+
+
+def test_running_without_ready_file_is_not_started(fake_project, monkeypatch):
+    # The PID is alive from the moment it is spawned, but it has not reported ready
+    monkeypatch.setenv("FAKE_DELAY", "30")
+
+    process, running, pid, _ = asyncio.run(start_and_wait(timeout=0.5))
+
+    assert not running
+    assert pid is None
+
+
+def test_timeout_stops_the_spawned_child(fake_project, monkeypatch):
+    monkeypatch.setenv("FAKE_DELAY", "30")
+
+    async def run():
+        process = await api_server.start_project_service(api_server.app)
+        running, _ = await api_server.wait_for_project_start(api_server.app, process, timeout=0.5)
+        return process, running
+
+    process, running = asyncio.run(run())
+
+    assert not running
+    assert process.returncode is not None
+    assert api_server.app.state.child_proc is None
+    assert not os.path.exists(api_server.project_pid_file)
+
+
+def test_stale_ready_file_is_ignored(fake_project, monkeypatch):
+    # A ready file left by an earlier run must not satisfy a new start
+    (fake_project / api_server.project_ready_file).write_text(str(os.getpid()))
+    monkeypatch.setenv("FAKE_DELAY", "30")
+
+    _, running, _, _ = asyncio.run(start_and_wait(timeout=0.5))
+
+    assert not running
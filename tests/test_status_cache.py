@@ -0,0 +1,85 @@
+"""Tests for the short-lived, single-flight /status cache"""
+
+import asyncio
+
+import pytest
+
+import api_server
+
+
+@pytest.fixture
+def compute_calls(workdir, monkeypatch):
+    """Replace compute_service_status with a slow stub that counts its calls"""
+    calls = []
+
+    async def compute_service_status():
+        calls.append(None)
+        await asyncio.sleep(0.05)
+        return api_server.ServiceStatus(running=False, pid=len(calls))
+
+    monkeypatch.setattr(api_server, "compute_service_status", compute_service_status)
+    return calls
+
+
+def test_reused_within_ttl(compute_calls):
+    async def poll():
+        return [await api_server.get_service_status() for _ in range(5)]
+
+    statuses = asyncio.run(poll())
+
+    assert len(compute_calls) == 1
+    assert all(status is statuses[0] for status in statuses)
+
+
+def test_recomputed_after_ttl(compute_calls, monkeypatch):
+    monkeypatch.setattr(api_server, "STATUS_CACHE_TTL", 0.0)
+
+    async def poll():
+        return [await api_server.get_service_status() for _ in range(3)]
+
+    statuses = asyncio.run(poll())
+
+    assert len(compute_calls) == 3
+    assert [status.pid for status in statuses] == [1, 2, 3]
+
+
+def test_concurrent_polls_share_one_computation(compute_calls):
+    async def burst():
+        return await asyncio.gather(*(api_server.get_service_status() for _ in range(20)))
+
+    statuses = asyncio.run(burst())
+
+    assert len(compute_calls) == 1
+    assert {status.pid for status in statuses} == {1}
+
+
+def test_invalidation_forces_recompute(compute_calls):
+    async def poll():
+        first = await api_server.get_service_status()
+        api_server.invalidate_status_cache()
+        return first, await api_server.get_service_status()
+
+    first, second = asyncio.run(poll())
+
+    assert len(compute_calls) == 2
+    assert (first.pid, second.pid) == (1, 2)
+
+
+def test_failed_computation_is_not_cached(workdir, monkeypatch):
+    calls = []
+
+    async def compute_service_status():
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return api_server.ServiceStatus(running=False)
+
+    monkeypatch.setattr(api_server, "compute_service_status", compute_service_status)
+
+    async def poll():
+        with pytest.raises(RuntimeError):
+            await api_server.get_service_status()
+        return await api_server.get_service_status()
+
+    assert asyncio.run(poll()).running is False
+    assert len(calls) == 2
@@ -0,0 +1,48 @@
+"""Tests for the reverse audit log tail reader behind /audit-log and /status"""
+
+import pytest
+
+import api_server
+from helpers import expected_ids, tail_ids, write_log
+
+
+class TestTailLines:
+    @pytest.mark.parametrize("limit", [1, 3, 10, 50])
+    def test_lines_spanning_chunk_boundaries(self, tmp_path, small_chunks, limit):
+        log = tmp_path / "audit.log"
+        write_log(log, [{"i": i, "pad": "x" * (i % 7)} for i in range(50)])
+
+        assert tail_ids(log, limit) == expected_ids(50, limit)
+
+    def test_line_longer_than_chunk(self, tmp_path, small_chunks):
+        log = tmp_path / "audit.log"
+        write_log(log, [{"i": 0}, {"i": 1, "pad": "x" * 100}, {"i": 2}])
+
+        assert tail_ids(log, 3) == [2, 1, 0]
+
+    def test_no_trailing_newline(self, tmp_path, small_chunks):
+        log = tmp_path / "audit.log"
+        write_log(log, [{"i": i} for i in range(5)], trailing_newline=False)
+
+        assert tail_ids(log, 2) == [4, 3]
+        assert tail_ids(log, 10) == [4, 3, 2, 1, 0]
+
+    def test_limit_larger_than_record_count(self, tmp_path):
+        log = tmp_path / "audit.log"
+        write_log(log, [{"i": i} for i in range(3)])
+
+        assert tail_ids(log, 100) == [2, 1, 0]
+
+    def test_empty_file_and_zero_limit(self, tmp_path):
+        log = tmp_path / "audit.log"
+        log.write_bytes(b"")
+        assert list(api_server._tail_lines(str(log), 10)) == []
+
+        write_log(log, [{"i": 0}])
+        assert list(api_server._tail_lines(str(log), 0)) == []
+
+    def test_blank_and_invalid_lines_skipped(self, tmp_path):
+        log = tmp_path / "audit.log"
+        log.write_bytes(b'{"i": 0}\n\nnot json\n{"i": 1}\n\n')
+
+        assert tail_ids(log, 10) == [1, 0]